@@ -129,6 +129,7 @@
 #define LETTER_Y              24   /* ARRAY INDEX FOR LETTER Y               */
 #define LETTER_Z              25   /* ARRAY INDEX FOR LETTER Z               */
 #define MGRS_LETTERS            3  /* NUMBER OF LETTERS IN MGRS              */
+#define MGRS_RECORD            16  /* BYTES PER STRING IN BATCH CONVERSIONS  */
 #define ONEHT          100000.e0    /* ONE HUNDRED THOUSAND                  */
 #define TWOMIL        2000000.e0    /* TWO MILLION                           */
 #define TRUE                      1  /* CONSTANT VALUE FOR TRUE VALUE  */
@@ -820,6 +821,101 @@ long Convert_Geodetic_To_MGRS (double Latitude,
 } /* Convert_Geodetic_To_MGRS */
 
 
+long Convert_Geodetic_To_UTM_And_MGRS (double Latitude,
+                                       double Longitude,
+                                       long Precision,
+                                       char *MGRS,
+                                       long *Zone,
+                                       char *Hemisphere,
+                                       double *Easting,
+                                       double *Northing)
+/*
+ * The function Convert_Geodetic_To_UTM_And_MGRS converts Geodetic (latitude
+ * and longitude) coordinates to an MGRS coordinate string and also returns
+ * the intermediate UTM (zone, hemisphere, easting and northing) coordinates,
+ * running the UTM projection only once.  Only latitudes within the UTM
+ * range are supported; polar coordinates return MGRS_LAT_ERROR.  If any
+ * errors occur, the error code(s) are returned by the function, otherwise
+ * MGRS_NO_ERROR is returned.
+ *
+ *    Latitude   : Latitude in radians              (input)
+ *    Longitude  : Longitude in radians             (input)
+ *    Precision  : Precision level of MGRS string   (input)
+ *    MGRS       : MGRS coordinate string           (output)
+ *    Zone       : UTM zone                         (output)
+ *    Hemisphere : North or South hemisphere        (output)
+ *    Easting    : Easting (X) in meters            (output)
+ *    Northing   : Northing (Y) in meters           (output)
+ *
+ */
+{ /* Convert_Geodetic_To_UTM_And_MGRS */
+  long zone;
+  char hemisphere;
+  double easting;
+  double northing;
+  long temp_error_code = MGRS_NO_ERROR;
+  long error_code = MGRS_NO_ERROR;
+
+  if ((Latitude < -PI_OVER_2) || (Latitude > PI_OVER_2))
+  { /* Latitude out of range */
+    error_code |= MGRS_LAT_ERROR;
+  }
+  if ((Longitude < -PI) || (Longitude > (2*PI)))
+  { /* Longitude out of range */
+    error_code |= MGRS_LON_ERROR;
+  }
+  if ((Precision < 0) || (Precision > MAX_PRECISION))
+    error_code |= MGRS_PRECISION_ERROR;
+  if ((Latitude < MIN_UTM_LAT) || (Latitude > MAX_UTM_LAT))
+  { /* Polar coordinates have no UTM representation */
+    error_code |= MGRS_LAT_ERROR;
+  }
+  if (!error_code)
+  {
+    temp_error_code = Set_UTM_Parameters (MGRS_a, MGRS_f, 0);
+    if (!temp_error_code)
+      temp_error_code = Convert_Geodetic_To_UTM (Latitude, Longitude, &zone, &hemisphere, &easting, &northing);
+
+    /* Apply the zone 31V eastern edge override here rather than leaving it
+       to UTM_To_MGRS, so that the UTM outputs match the MGRS string;
+       UTM_To_MGRS then sees zone 32 and does not reconvert. */
+    if (!temp_error_code &&
+        (zone == 31) && (((Latitude >= 56.0 * DEG_TO_RAD) && (Latitude < 64.0 * DEG_TO_RAD)) && ((Longitude >= 3.0 * DEG_TO_RAD) || (easting >= 500000.0))))
+    {
+      Set_UTM_Parameters (MGRS_a, MGRS_f, 32);
+      temp_error_code = Convert_Geodetic_To_UTM (Latitude, Longitude, &zone, &hemisphere, &easting, &northing);
+    }
+
+    if (!temp_error_code)
+    {
+      error_code |= UTM_To_MGRS (zone, hemisphere, Longitude, Latitude, easting, northing, Precision, MGRS);
+      *Zone = zone;
+      *Hemisphere = hemisphere;
+      *Easting = easting;
+      *Northing = northing;
+    }
+    else
+    {
+      if(temp_error_code & UTM_LAT_ERROR)
+        error_code |= MGRS_LAT_ERROR;
+      if(temp_error_code & UTM_LON_ERROR)
+        error_code |= MGRS_LON_ERROR;
+      if(temp_error_code & UTM_ZONE_OVERRIDE_ERROR)
+        error_code |= MGRS_ZONE_ERROR;
+      if(temp_error_code & UTM_EASTING_ERROR)
+        error_code |= MGRS_EASTING_ERROR;
+      if(temp_error_code & UTM_NORTHING_ERROR)
+        error_code |= MGRS_NORTHING_ERROR;
+      if(temp_error_code & UTM_A_ERROR)
+        error_code |= MGRS_A_ERROR;
+      if(temp_error_code & UTM_INV_F_ERROR)
+        error_code |= MGRS_INV_F_ERROR;
+    }
+  }
+  return (error_code);
+} /* Convert_Geodetic_To_UTM_And_MGRS */
+
+
 long Convert_MGRS_To_Geodetic (char* MGRS,
                                double *Latitude,
                                double *Longitude)
@@ -1308,5 +1404,147 @@ long Convert_MGRS_To_UPS ( char   *MGRS,
   return (error_code);
 } /* Convert_MGRS_To_UPS */
 
+long Convert_Geodetic_To_MGRS_Batch (const double* Latitude,
+                                     const double* Longitude,
+                                     long Count,
+                                     long Precision,
+                                     char* MGRS)
+/*
+ * The function Convert_Geodetic_To_MGRS_Batch converts an array of geodetic
+ * (latitude and longitude) coordinates to MGRS coordinate strings with a
+ * single library call, so that callers do not pay per-point call overhead.
+ * Strings are written as fixed 16-byte null-terminated records.  Conversion
+ * stops at the first point in error and the error code(s) are returned by
+ * the function, otherwise MGRS_NO_ERROR is returned.
+ *
+ *    Latitude   : Array of latitudes in radians                  (input)
+ *    Longitude  : Array of longitudes in radians                 (input)
+ *    Count      : Number of points to convert                    (input)
+ *    Precision  : Precision level of MGRS strings                (input)
+ *    MGRS       : Array of Count * MGRS_RECORD MGRS characters   (output)
+ *
+ */
+{ /* Convert_Geodetic_To_MGRS_Batch */
+  long i;
+  long error_code = MGRS_NO_ERROR;
+
+  for (i = 0; i < Count; i++)
+  {
+    error_code = Convert_Geodetic_To_MGRS (Latitude[i], Longitude[i],
+                                           Precision, MGRS + i * MGRS_RECORD);
+    if (error_code)
+      break;
+  }
+  return (error_code);
+} /* Convert_Geodetic_To_MGRS_Batch */
+
+
+long Convert_MGRS_To_Geodetic_Batch (char* MGRS,
+                                     long Count,
+                                     double* Latitude,
+                                     double* Longitude)
+/*
+ * The function Convert_MGRS_To_Geodetic_Batch converts an array of MGRS
+ * coordinate strings, stored as fixed 16-byte null-terminated records, to
+ * geodetic (latitude and longitude) coordinates with a single library call.
+ * Conversion stops at the first string in error and the error code(s) are
+ * returned by the function, otherwise MGRS_NO_ERROR is returned.
+ *
+ *    MGRS       : Array of Count * MGRS_RECORD MGRS characters   (input)
+ *    Count      : Number of strings to convert                   (input)
+ *    Latitude   : Array of latitudes in radians                  (output)
+ *    Longitude  : Array of longitudes in radians                 (output)
+ *
+ */
+{ /* Convert_MGRS_To_Geodetic_Batch */
+  long i;
+  long error_code = MGRS_NO_ERROR;
+
+  for (i = 0; i < Count; i++)
+  {
+    error_code = Convert_MGRS_To_Geodetic (MGRS + i * MGRS_RECORD,
+                                           &Latitude[i], &Longitude[i]);
+    if (error_code)
+      break;
+  }
+  return (error_code);
+} /* Convert_MGRS_To_Geodetic_Batch */
+
+
+long Convert_UTM_To_MGRS_Batch (const long* Zone,
+                                const char* Hemisphere,
+                                const double* Easting,
+                                const double* Northing,
+                                long Count,
+                                long Precision,
+                                char* MGRS)
+/*
+ * The function Convert_UTM_To_MGRS_Batch converts arrays of UTM (zone,
+ * hemisphere, easting and northing) coordinates to MGRS coordinate strings
+ * with a single library call.  Strings are written as fixed 16-byte
+ * null-terminated records.  Conversion stops at the first point in error
+ * and the error code(s) are returned by the function, otherwise
+ * MGRS_NO_ERROR is returned.
+ *
+ *    Zone       : Array of UTM zones                             (input)
+ *    Hemisphere : Array of hemispheres ('N' or 'S')              (input)
+ *    Easting    : Array of eastings (X) in meters                (input)
+ *    Northing   : Array of northings (Y) in meters               (input)
+ *    Count      : Number of points to convert                    (input)
+ *    Precision  : Precision level of MGRS strings                (input)
+ *    MGRS       : Array of Count * MGRS_RECORD MGRS characters   (output)
+ */
+{ /* Convert_UTM_To_MGRS_Batch */
+  long i;
+  long error_code = MGRS_NO_ERROR;
+
+  for (i = 0; i < Count; i++)
+  {
+    error_code = Convert_UTM_To_MGRS (Zone[i], Hemisphere[i], Easting[i],
+                                      Northing[i], Precision,
+                                      MGRS + i * MGRS_RECORD);
+    if (error_code)
+      break;
+  }
+  return (error_code);
+} /* Convert_UTM_To_MGRS_Batch */
+
+
+long Convert_MGRS_To_UTM_Batch (char* MGRS,
+                                long Count,
+                                long* Zone,
+                                char* Hemisphere,
+                                double* Easting,
+                                double* Northing)
+/*
+ * The function Convert_MGRS_To_UTM_Batch converts an array of MGRS
+ * coordinate strings, stored as fixed 16-byte null-terminated records, to
+ * UTM projection (zone, hemisphere, easting and northing) coordinates with
+ * a single library call.  Conversion stops at the first string in error and
+ * the error code(s) are returned by the function, otherwise MGRS_NO_ERROR
+ * is returned.
+ *
+ *    MGRS       : Array of Count * MGRS_RECORD MGRS characters   (input)
+ *    Count      : Number of strings to convert                   (input)
+ *    Zone       : Array of UTM zones                             (output)
+ *    Hemisphere : Array of hemispheres ('N' or 'S')              (output)
+ *    Easting    : Array of eastings (X) in meters                (output)
+ *    Northing   : Array of northings (Y) in meters               (output)
+ */
+{ /* Convert_MGRS_To_UTM_Batch */
+  long i;
+  long error_code = MGRS_NO_ERROR;
+
+  for (i = 0; i < Count; i++)
+  {
+    error_code = Convert_MGRS_To_UTM (MGRS + i * MGRS_RECORD, &Zone[i],
+                                      &Hemisphere[i], &Easting[i],
+                                      &Northing[i]);
+    if (error_code)
+      break;
+  }
+  return (error_code);
+} /* Convert_MGRS_To_UTM_Batch */
+
 void initlibmgrs() {}
 void PyInit_libmgrs() {}
@@ -214,6 +214,123 @@ extern "C" {
  */
 
 
+  long USE_DLL Convert_Geodetic_To_UTM_And_MGRS (double Latitude,
+                                         double Longitude,
+                                         long Precision,
+                                         char *MGRS,
+                                         long *Zone,
+                                         char *Hemisphere,
+                                         double *Easting,
+                                         double *Northing);
+/*
+ * The function Convert_Geodetic_To_UTM_And_MGRS converts geodetic (latitude
+ * and longitude) coordinates to an MGRS coordinate string and also returns
+ * the intermediate UTM (zone, hemisphere, easting and northing) coordinates,
+ * running the UTM projection only once.  Only latitudes within the UTM
+ * range are supported; polar coordinates return MGRS_LAT_ERROR.  If any
+ * errors occur, the error code(s) are returned by the function, otherwise
+ * MGRS_NO_ERROR is returned.
+ *
+ *    Latitude   : Latitude in radians              (input)
+ *    Longitude  : Longitude in radians             (input)
+ *    Precision  : Precision level of MGRS string   (input)
+ *    MGRS       : MGRS coordinate string           (output)
+ *    Zone       : UTM zone                         (output)
+ *    Hemisphere : North or South hemisphere        (output)
+ *    Easting    : Easting (X) in meters            (output)
+ *    Northing   : Northing (Y) in meters           (output)
+ */
+
+
+
+  long USE_DLL Convert_Geodetic_To_MGRS_Batch (const double* Latitude,
+                                       const double* Longitude,
+                                       long Count,
+                                       long Precision,
+                                       char *MGRS);
+/*
+ * The function Convert_Geodetic_To_MGRS_Batch converts an array of geodetic
+ * (latitude and longitude) coordinates to MGRS coordinate strings with a
+ * single library call.  Strings are written as fixed 16-byte null-terminated
+ * records.  Conversion stops at the first point in error and the error
+ * code(s) are returned by the function, otherwise MGRS_NO_ERROR is returned.
+ *
+ *    Latitude   : Array of latitudes in radians                (input)
+ *    Longitude  : Array of longitudes in radians               (input)
+ *    Count      : Number of points to convert                  (input)
+ *    Precision  : Precision level of MGRS strings              (input)
+ *    MGRS       : Array of Count * 16 MGRS characters          (output)
+ *
+ */
+
+
+  long USE_DLL Convert_MGRS_To_Geodetic_Batch (char *MGRS,
+                                       long Count,
+                                       double* Latitude,
+                                       double* Longitude);
+/*
+ * The function Convert_MGRS_To_Geodetic_Batch converts an array of MGRS
+ * coordinate strings, stored as fixed 16-byte null-terminated records, to
+ * geodetic (latitude and longitude) coordinates with a single library call.
+ * Conversion stops at the first string in error and the error code(s) are
+ * returned by the function, otherwise MGRS_NO_ERROR is returned.
+ *
+ *    MGRS       : Array of Count * 16 MGRS characters          (input)
+ *    Count      : Number of strings to convert                 (input)
+ *    Latitude   : Array of latitudes in radians                (output)
+ *    Longitude  : Array of longitudes in radians               (output)
+ *
+ */
+
+
+  long USE_DLL Convert_UTM_To_MGRS_Batch (const long* Zone,
+                                  const char* Hemisphere,
+                                  const double* Easting,
+                                  const double* Northing,
+                                  long Count,
+                                  long Precision,
+                                  char *MGRS);
+/*
+ * The function Convert_UTM_To_MGRS_Batch converts arrays of UTM (zone,
+ * hemisphere, easting and northing) coordinates to MGRS coordinate strings
+ * with a single library call.  Strings are written as fixed 16-byte
+ * null-terminated records.  Conversion stops at the first point in error
+ * and the error code(s) are returned by the function, otherwise
+ * MGRS_NO_ERROR is returned.
+ *
+ *    Zone       : Array of UTM zones                           (input)
+ *    Hemisphere : Array of hemispheres ('N' or 'S')            (input)
+ *    Easting    : Array of eastings (X) in meters              (input)
+ *    Northing   : Array of northings (Y) in meters             (input)
+ *    Count      : Number of points to convert                  (input)
+ *    Precision  : Precision level of MGRS strings              (input)
+ *    MGRS       : Array of Count * 16 MGRS characters          (output)
+ */
+
+
+  long USE_DLL Convert_MGRS_To_UTM_Batch (char *MGRS,
+                                  long Count,
+                                  long *Zone,
+                                  char *Hemisphere,
+                                  double *Easting,
+                                  double *Northing);
+/*
+ * The function Convert_MGRS_To_UTM_Batch converts an array of MGRS
+ * coordinate strings, stored as fixed 16-byte null-terminated records, to
+ * UTM projection (zone, hemisphere, easting and northing) coordinates with
+ * a single library call.  Conversion stops at the first string in error and
+ * the error code(s) are returned by the function, otherwise MGRS_NO_ERROR
+ * is returned.
+ *
+ *    MGRS       : Array of Count * 16 MGRS characters          (input)
+ *    Count      : Number of strings to convert                 (input)
+ *    Zone       : Array of UTM zones                           (output)
+ *    Hemisphere : Array of hemispheres ('N' or 'S')            (output)
+ *    Easting    : Array of eastings (X) in meters              (output)
+ *    Northing   : Array of northings (Y) in meters             (output)
+ */
+
+
 
   long USE_DLL Convert_UPS_To_MGRS ( char   Hemisphere,
                              double Easting,
@@ -1,15 +1,120 @@
 import ctypes
+import re
+import weakref
+from collections.abc import Sequence
 from typing import Self
 
+import numpy as np
+
 from . import core
 
+try:
+    from . import _numba_kernel
+except ImportError:  # numba is an optional dependency
+    _numba_kernel = None
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is an optional dependency
+    hyperscan = None
+
 __version__ = "1.5.0"
 
+# Batch size above which the numba kernel is worth its dispatch overhead.
+_NUMBA_BATCH_THRESHOLD = 1024
+
+# MGRS grammar: a 1 or 2 digit UTM zone, a latitude band letter, two
+# 100,000-meter square letters (I and O are never used), and an even-length
+# digit tail encoding easting then northing at the chosen precision.
+_MGRS_RE = re.compile(r"[0-9]{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}(?:[0-9][0-9]){0,5}")
+
+# Latitude range of the UTM grid, matching the MIN_UTM_LAT / MAX_UTM_LAT
+# constants in libmgrs; outside of it, conversions produce UPS strings,
+# which this class does not accept.
+_PI = 3.14159265358979323
+_MIN_UTM_LAT = (-80 * _PI) / 180.0
+_MAX_UTM_LAT = (84 * _PI) / 180.0
+
+# Hyperscan database for the MGRS grammar, compiled lazily on the first
+# bulk validation.  In multiline mode the anchors match around the
+# newline separators that valid_mask joins the input with.
+_hs_db = None
+
+
+def _hs_database():
+    global _hs_db
+    if _hs_db is None:
+        _hs_db = hyperscan.Database()
+        _hs_db.compile(
+            expressions=[rb"^[0-9]{1,2}[C-HJ-NP-X][A-HJ-NP-Z]{2}([0-9][0-9]){0,5}$"],
+            ids=[0],
+            flags=[hyperscan.HS_FLAG_MULTILINE],
+        )
+    return _hs_db
+
 
 class MGRS:
+    __slots__ = ("_mgrs", "_mgrs_bytes", "_hash", "_precision", "_zone", "__weakref__")
+
+    _interned: "weakref.WeakValueDictionary[str, MGRS]" = weakref.WeakValueDictionary()
+
     def __init__(self, mgrs: str):
+        if _MGRS_RE.fullmatch(mgrs) is None:
+            # The grammar only covers canonical spellings; the C parser is
+            # laxer (lowercase letters, leading blanks), so give it the
+            # final say before rejecting.
+            try:
+                core.mgrs_to_utm(mgrs.encode("ascii"))
+            except (UnicodeEncodeError, core.MGRSError):
+                raise core.MGRSError(f"Ill-formed MGRS string {mgrs!r}") from None
+        self._fill(mgrs)
+
+    def _fill(self, mgrs: str) -> None:
         self._mgrs = mgrs
-        _ = self.to_utm()  # dummy call to raise error if `mgrs` is ill-formed.
+        self._mgrs_bytes = mgrs.encode("ascii")
+        self._hash = hash(mgrs)
+        i = 1 if mgrs[1].isalpha() else 2  # the zone may have a single digit
+        self._zone = int(mgrs[:i])
+        self._precision = (len(mgrs) - i - 3) // 2
+
+    @classmethod
+    def _unchecked(cls, mgrs: str) -> Self:
+        """Build an instance without the grammar check.
+
+        For strings produced by the library itself, which are known to be
+        well-formed; skips the regex match that dominates construction cost.
+        """
+        obj = object.__new__(cls)
+        obj._fill(mgrs)
+        return obj
+
+    @classmethod
+    def intern(cls, mgrs: str) -> Self:
+        """Return a canonical shared instance for the given MGRS string.
+
+        Pipelines that create the same handful of MGRS tiles millions of
+        times can use this instead of the constructor to get the same
+        object back on every call, like :func:`sys.intern` for strings.
+        Two interned tiles with the same id compare identical with ``is``.
+        Instances are kept alive only as long as they are referenced
+        elsewhere.
+
+        Parameters
+        ----------
+        mgrs : str
+            The string id of the MGRS tile.
+
+        Returns
+        -------
+        MGRS
+            The canonical instance for `mgrs`.
+        """
+        try:
+            return cls._interned[mgrs]
+        except KeyError:
+            obj = cls(mgrs)
+            cls._interned[mgrs] = obj
+            return obj
 
     @property
     def mgrs(self) -> str:
@@ -23,66 +128,56 @@ class MGRS:
         return f"MGRS(mgrs={self.mgrs})"
 
     def __hash__(self):
-        return hash(self.mgrs)
+        return self._hash
 
     def __eq__(self, other):
-        if not isinstance(other, type(self)):
-            raise TypeError(
-                f"Cannot compare MGRS object of type {type(self)} with object of type {type(other)}"
-            )
-        return hash(self) == hash(other)
+        if type(other) is not MGRS:
+            return NotImplemented
+        return self._mgrs == other._mgrs
 
     def __lt__(self, other):
-        if not isinstance(other, type(self)):
-            raise TypeError(
-                f"Cannot compare MGRS object of type {type(self)} with object of type {type(other)}"
-            )
-        return self.mgrs < other.mgrs
+        if type(other) is not MGRS:
+            return NotImplemented
+        return self._mgrs < other._mgrs
 
     def __le__(self, other):
-        if not isinstance(other, type(self)):
-            raise TypeError(
-                f"Cannot compare MGRS object of type {type(self)} with object of type {type(other)}"
-            )
-        return self.mgrs <= other.mgrs
+        if type(other) is not MGRS:
+            return NotImplemented
+        return self._mgrs <= other._mgrs
 
     def __gt__(self, other):
-        if not isinstance(other, type(self)):
-            raise TypeError(
-                f"Cannot compare MGRS object of type {type(self)} with object of type {type(other)}"
-            )
-        return self.mgrs > other.mgrs
+        if type(other) is not MGRS:
+            return NotImplemented
+        return self._mgrs > other._mgrs
 
     def __ge__(self, other):
-        if not isinstance(other, type(self)):
-            raise TypeError(
-                f"Cannot compare MGRS object of type {type(self)} with object of type {type(other)}"
-            )
-        return self.mgrs >= other.mgrs
+        if type(other) is not MGRS:
+            return NotImplemented
+        return self._mgrs >= other._mgrs
 
     @property
     def precision(self) -> int:
-        return (len(self.mgrs) - 5) // 2
+        return self._precision
 
     @property
     def utm_zone(self) -> int:
         """The UTM zone number of the MGRS tile."""
-        return int(self.mgrs[:2])
+        return self._zone
 
     @property
     def utm_letter(self) -> str:
         """The UTM zone letter of the MGRS tile."""
-        return self.mgrs[2]
+        return self._mgrs[-2 * self._precision - 3]
 
     @property
     def easting_letter(self) -> str:
         """The easting letter of the MGRS tile, within the UTM zone."""
-        return self.mgrs[3]
+        return self._mgrs[-2 * self._precision - 2]
 
     @property
     def northing_letter(self) -> str:
         """The northing letter of the MGRS tile, within the UTM zone."""
-        return self.mgrs[4]
+        return self._mgrs[-2 * self._precision - 1]
 
     def with_precision(self, precision: int) -> Self:
         """Compute the MGRS at a lower precision.
@@ -99,7 +194,10 @@ class MGRS:
         """
         if precision > self.precision:
             raise ValueError("Cannot increase precision")
-        return MGRS(self.mgrs[: 5 + 2 * precision])
+        head = len(self.mgrs) - 2 * self.precision
+        easting = self.mgrs[head : head + precision]
+        northing = self.mgrs[head + self.precision : head + self.precision + precision]
+        return MGRS._unchecked(self.mgrs[:head] + easting + northing)
 
     @classmethod
     def from_utm(
@@ -129,21 +227,63 @@ class MGRS:
         -------
         mgrs: MGRS
         """
-        mgrs = ctypes.create_string_buffer(80)
+        mgrs = core.utm_to_mgrs(
+            zone, hemisphere.encode("ascii"), easting, northing, precision
+        )
+        return cls._unchecked(mgrs)
+
+    @classmethod
+    def from_utm_batch(
+        cls,
+        zones,
+        hemispheres,
+        eastings,
+        northings,
+        precision: int = 5,
+    ) -> list[Self]:
+        """Compute the MGRS coordinates of points given in UTM coordinates.
+
+        The whole batch is converted with a single library call.
+
+        Parameters
+        ----------
+        zones : array_like
+            1-dimensional array of UTM zone numbers.
+        hemispheres : array_like
+            1-dimensional array of UTM hemispheres, 'N' for north or 'S' for south.
+        eastings, northings : array_like
+            1-dimensional arrays of easting and northing coordinates.
+        precision : int
+            The MGRS precision scale, from 0 (least precise) to 5 (most precise). Default is 5.
 
-        hemisphere_encoded = hemisphere.encode("utf-8")
+        Returns
+        -------
+        list[MGRS]
+            The MGRS zone of each point, in input order.
+        """
+        zones_ = np.ascontiguousarray(zones, dtype=np.dtype(ctypes.c_long))
+        hemispheres_ = np.ascontiguousarray(hemispheres, dtype="S1")
+        eastings_ = np.ascontiguousarray(eastings, dtype=np.float64)
+        northings_ = np.ascontiguousarray(northings, dtype=np.float64)
+        if zones_.ndim != 1 or not (
+            zones_.shape == hemispheres_.shape == eastings_.shape == northings_.shape
+        ):
+            raise ValueError(
+                "zones, hemispheres, eastings and northings must be "
+                "1-dimensional arrays of the same length"
+            )
 
-        hemisphere_c = ctypes.c_char(hemisphere_encoded)
-        core.rt.Convert_UTM_To_MGRS(
-            zone,
-            hemisphere_c,
-            ctypes.c_double(easting),
-            ctypes.c_double(northing),
+        out = np.zeros((zones_.size, 16), dtype="S1")
+        core.rt.Convert_UTM_To_MGRS_Batch(
+            zones_.ctypes.data_as(ctypes.POINTER(ctypes.c_long)),
+            hemispheres_.ctypes.data_as(ctypes.c_char_p),
+            eastings_.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            northings_.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            zones_.size,
             precision,
-            mgrs,
+            out.ctypes.data_as(ctypes.c_char_p),
         )
-
-        return cls(mgrs.value.decode("utf-8"))
+        return [cls._unchecked(c.decode("ascii")) for c in out.view("S16").ravel()]
 
     @classmethod
     def from_lat_lon(
@@ -170,16 +310,167 @@ class MGRS:
             The MGRS zone.
         """
         if in_degrees:
-            lat = core.TO_RADIANS(latitude)
-            lon = core.TO_RADIANS(longitude)
+            lat = latitude * core.DEG_TO_RAD
+            lon = longitude * core.DEG_TO_RAD
         else:
             lat = latitude
             lon = longitude
 
-        p = ctypes.create_string_buffer(80)
-        core.rt.Convert_Geodetic_To_MGRS(lat, lon, precision, p)
-        c = ctypes.string_at(p)
-        return cls(mgrs=c.decode("utf-8"))
+        mgrs = core.geodetic_to_mgrs(lat, lon, precision)
+        if _MIN_UTM_LAT <= lat <= _MAX_UTM_LAT:
+            return cls._unchecked(mgrs)
+        # polar coordinates produce a UPS string, which the grammar rejects
+        return cls(mgrs)
+
+    @classmethod
+    def from_lat_lon_with_utm(
+        cls,
+        latitude: float,
+        longitude: float,
+        in_degrees: bool = True,
+        precision: int = 5,
+    ) -> tuple[Self, int, str, float, float]:
+        """Convert lat/lon coordinates to MGRS and UTM with a single projection.
+
+        Returns the same tile as :meth:`from_lat_lon`, along with the exact
+        UTM coordinates of the input point — not the tile corner that
+        :meth:`to_utm` would return after truncation to the MGRS grid.
+        The UTM projection underlying both outputs is run only once.
+        Unlike :meth:`from_lat_lon`, polar coordinates (latitude outside
+        [-80°, 84°]) are always rejected, since they have no UTM
+        representation.
+
+        Parameters
+        ----------
+        latitude, longitude : float
+            Coordinates in degrees or radian.
+        in_degrees : bool
+            True if coordinates are given in degrees, False if they are in radian. Default is True.
+        precision : int
+            The MGRS precision scale, from 0 (least precise) to 5 (most precise). Default is 5.
+
+        Returns
+        -------
+        tuple[MGRS, int, str, float, float]
+            The MGRS zone, followed by the UTM zone number, hemisphere
+            ('N' or 'S'), easting and northing of the point.
+        """
+        if in_degrees:
+            lat = latitude * core.DEG_TO_RAD
+            lon = longitude * core.DEG_TO_RAD
+        else:
+            lat = latitude
+            lon = longitude
+
+        mgrs, zone, hemisphere, easting, northing = core.geodetic_to_utm_and_mgrs(
+            lat, lon, precision
+        )
+        return (cls._unchecked(mgrs), zone, hemisphere.decode("ascii"), easting, northing)
+
+    @classmethod
+    def from_lat_lon_array(
+        cls,
+        latitudes,
+        longitudes,
+        in_degrees: bool = True,
+        precision: int = 5,
+    ) -> np.ndarray:
+        """Convert lat/lon coordinates to MGRS zones, elementwise.
+
+        A ufunc wrapper around :meth:`from_lat_lon`: NumPy drives the
+        iteration and broadcasting, which is cheaper than a Python-level
+        loop on small or multi-dimensional inputs. For large 1-dimensional
+        batches, :meth:`from_lat_lon_batch` is much faster still.
+
+        Parameters
+        ----------
+        latitudes, longitudes : array_like
+            Coordinates in degrees or radian; broadcast against each other.
+        in_degrees : bool
+            True if coordinates are given in degrees, False if they are in radian. Default is True.
+        precision : int
+            The MGRS precision scale, from 0 (least precise) to 5 (most precise). Default is 5.
+
+        Returns
+        -------
+        np.ndarray
+            Object array of :class:`MGRS` instances, in the broadcast shape.
+        """
+        return _from_lat_lon_ufunc(latitudes, longitudes, in_degrees, precision)
+
+    @classmethod
+    def from_lat_lon_batch(
+        cls,
+        latitudes,
+        longitudes,
+        in_degrees: bool = True,
+        precision: int = 5,
+    ) -> list[Self]:
+        """Convert arrays of lat/lon coordinates to their encapsulating MGRS zones.
+
+        Unlike repeated calls to :meth:`from_lat_lon`, the whole batch is
+        converted with a single library call, which is much faster on large
+        inputs.
+
+        Parameters
+        ----------
+        latitudes, longitudes : array_like
+            1-dimensional arrays of coordinates, in degrees or radian.
+        in_degrees : bool
+            True if coordinates are given in degrees, False if they are in radian. Default is True.
+        precision : int
+            The MGRS precision scale, from 0 (least precise) to 5 (most precise). Default is 5.
+
+        Returns
+        -------
+        list[MGRS]
+            The MGRS zone of each point, in input order.
+        """
+        lats = np.ascontiguousarray(latitudes, dtype=np.float64)
+        lons = np.ascontiguousarray(longitudes, dtype=np.float64)
+        if lats.ndim != 1 or lats.shape != lons.shape:
+            raise ValueError(
+                "latitudes and longitudes must be 1-dimensional arrays of the same length"
+            )
+        if in_degrees:
+            lats = np.radians(lats)
+            lons = np.radians(lons)
+
+        in_utm_range = bool(((lats >= _MIN_UTM_LAT) & (lats <= _MAX_UTM_LAT)).all())
+
+        if (
+            _numba_kernel is not None
+            and lats.size >= _NUMBA_BATCH_THRESHOLD
+            and 0 <= precision <= 5
+            and in_utm_range
+        ):
+            out = np.zeros((lats.size, 16), dtype=np.uint8)
+            errors = _numba_kernel.geodetic_to_mgrs_batch(lats, lons, precision, out)
+            if not errors.any():
+                return [cls._unchecked(c.decode("ascii")) for c in out.view("S16").ravel()]
+            # on any error, redo the batch through the C library so that the
+            # caller gets its error code
+
+        out = np.zeros((lats.size, 16), dtype="S1")
+        core.rt.Convert_Geodetic_To_MGRS_Batch(
+            lats.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            lons.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            lats.size,
+            precision,
+            out.ctypes.data_as(ctypes.c_char_p),
+        )
+        # polar points produce UPS strings; route those through the checked
+        # constructor, which rejects them as before
+        make = cls._unchecked if in_utm_range else cls
+        return [make(c.decode("ascii")) for c in out.view("S16").ravel()]
+
+    @classmethod
+    def _pack(cls, tiles: Sequence[Self | str]) -> np.ndarray:
+        """Pack MGRS strings into fixed 16-byte records for batch conversion."""
+        strings = [tile.mgrs if isinstance(tile, cls) else tile for tile in tiles]
+        if any(len(s) > 15 for s in strings):
+            raise core.MGRSError("MGRS string too long (15 characters maximum)")
+        return np.array(strings, dtype="S16")
 
     def to_latlon(self, in_degrees: bool = True) -> tuple[float, float]:
         """Compute the center of a MGRS in lat/lon coordinate.
@@ -194,21 +485,46 @@ class MGRS:
         tuple[float, float]
             Latitude/longitude coordinate.
         """
-        plat = ctypes.pointer(ctypes.c_double())
-        plon = ctypes.pointer(ctypes.c_double())
+        lat, lon = core.mgrs_to_geodetic(self._mgrs_bytes)
 
-        mgrs = self.mgrs.encode("utf-8")
+        if in_degrees:
+            lat = lat * core.RAD_TO_DEG
+            lon = lon * core.RAD_TO_DEG
+        return (lat, lon)
+
+    @classmethod
+    def to_latlon_batch(
+        cls, tiles: Sequence[Self | str], in_degrees: bool = True
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Compute the centers of MGRS tiles in lat/lon coordinates.
 
-        c = ctypes.string_at(mgrs)
-        core.rt.Convert_MGRS_To_Geodetic(c, plat, plon)
+        The whole batch is converted with a single library call.
 
+        Parameters
+        ----------
+        tiles : Sequence[MGRS | str]
+            The MGRS tiles, as instances or string ids.
+        in_degrees : bool
+            If True, coordinates are given in degrees. If False, they are given in radian. Default is True.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Latitude and longitude coordinates, in input order.
+        """
+        records = cls._pack(tiles)
+        lats = np.empty(records.size, dtype=np.float64)
+        lons = np.empty(records.size, dtype=np.float64)
+        core.rt.Convert_MGRS_To_Geodetic_Batch(
+            records.ctypes.data_as(ctypes.c_char_p),
+            records.size,
+            lats.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            lons.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+        )
         if in_degrees:
-            lat = core.TO_DEGREES(plat.contents.value)
-            lon = core.TO_DEGREES(plon.contents.value)
-        else:
-            lat = plat.contents.value
-            lon = plon.contents.value
-        return (lat, lon)
+            np.degrees(lats, out=lats)
+            np.degrees(lons, out=lons)
+        return (lats, lons)
 
     def to_utm(self) -> tuple[int, str, float, float]:
         """Convert a MGRS tile to UTM coordinates.
@@ -224,26 +540,106 @@ class MGRS:
         northing: float
             Northing coordinates in the UTM zone.
         """
-        mgrs = self.mgrs.encode("utf-8")
-        mgrs = ctypes.string_at(mgrs)
-        zone = ctypes.pointer(ctypes.c_long())
-        hemisphere = ctypes.pointer(ctypes.c_char())
-        easting = ctypes.pointer(ctypes.c_double())
-        northing = ctypes.pointer(ctypes.c_double())
-
-        core.rt.Convert_MGRS_To_UTM(mgrs, zone, hemisphere, easting, northing)
-
-        return (
-            zone.contents.value,
-            hemisphere.contents.value.decode("utf-8"),
-            easting.contents.value,
-            northing.contents.value,
+        zone, hemisphere, easting, northing = core.mgrs_to_utm(self._mgrs_bytes)
+        return (zone, hemisphere.decode("ascii"), easting, northing)
+
+    @classmethod
+    def to_utm_batch(
+        cls, tiles: Sequence[Self | str]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Convert MGRS tiles to UTM coordinates.
+
+        The whole batch is converted with a single library call.
+
+        Parameters
+        ----------
+        tiles : Sequence[MGRS | str]
+            The MGRS tiles, as instances or string ids.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+            UTM zone numbers, hemispheres ('N' or 'S'), eastings and
+            northings, in input order.
+        """
+        records = cls._pack(tiles)
+        zones = np.empty(records.size, dtype=np.dtype(ctypes.c_long))
+        hemispheres = np.zeros(records.size, dtype="S1")
+        eastings = np.empty(records.size, dtype=np.float64)
+        northings = np.empty(records.size, dtype=np.float64)
+        core.rt.Convert_MGRS_To_UTM_Batch(
+            records.ctypes.data_as(ctypes.c_char_p),
+            records.size,
+            zones.ctypes.data_as(ctypes.POINTER(ctypes.c_long)),
+            hemispheres.ctypes.data_as(ctypes.c_char_p),
+            eastings.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
+            northings.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
         )
+        return (zones, hemispheres.astype("U1"), eastings, northings)
 
     @classmethod
     def is_valid(cls, mgrs: str) -> bool:
+        """Whether `mgrs` is a valid MGRS string.
+
+        The C parser has the final say, so non-canonical spellings that
+        it accepts (lowercase letters, leading blanks) are valid even
+        though the grammar in :meth:`valid_mask` rejects them.
+        """
         try:
-            cls(mgrs).to_utm()
+            core.mgrs_to_utm(mgrs.encode("ascii"))
             return True
-        except core.MGRSError:
+        except (UnicodeEncodeError, core.MGRSError):
             return False
+
+    @classmethod
+    def valid_mask(cls, strings: Sequence[str]) -> np.ndarray:
+        """Which of `strings` are well-formed MGRS strings.
+
+        A bulk version of the grammar check in :meth:`is_valid`, for
+        ingesting large amounts of untrusted strings. Unlike
+        :meth:`is_valid`, the strings are not round-tripped through the C
+        library, so a string that is well-formed but denotes no existing
+        tile is still marked valid. When the optional hyperscan package is
+        installed, the whole input is scanned in a single pass; otherwise
+        the compiled regex is applied in a Python loop.
+
+        Parameters
+        ----------
+        strings : Sequence[str]
+            The candidate MGRS strings.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array, True where the string matches the MGRS grammar.
+        """
+        mask = np.zeros(len(strings), dtype=bool)
+        if hyperscan is not None and len(strings) > 0:
+            try:
+                buf = "\n".join(strings).encode("ascii")
+            except UnicodeEncodeError:
+                buf = None
+            if buf is not None:
+                separators = np.flatnonzero(np.frombuffer(buf, dtype=np.uint8) == 10)
+                # embedded newlines would break the line <-> string mapping;
+                # such strings cannot be valid, so fall back to the regex loop
+                if separators.size == len(strings) - 1:
+                    # offset past each line; a match ends exactly there
+                    ends = np.append(separators, len(buf))
+                    hits: list[int] = []
+
+                    def on_match(id_, start, to, flags, context):
+                        hits.append(to)
+
+                    _hs_database().scan(buf, match_event_handler=on_match)
+                    mask[np.searchsorted(ends, hits)] = True
+                    return mask
+
+        match = _MGRS_RE.fullmatch
+        for i, s in enumerate(strings):
+            if match(s) is not None:
+                mask[i] = True
+        return mask
+
+
+_from_lat_lon_ufunc = np.frompyfunc(MGRS.from_lat_lon, 4, 1)
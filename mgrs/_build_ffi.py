@@ -0,0 +1,78 @@
+"""cffi build script for the API-mode bindings to libmgrs.
+
+Compiled through the ``cffi_modules`` hook in ``setup.py`` when cffi is
+available at build time.  The resulting ``mgrs._libmgrs`` module calls into
+the library through a compiled trampoline, which is noticeably cheaper per
+call than going through ctypes/libffi.  The package falls back to the
+ctypes bindings in ``mgrs.core`` when this module has not been built.
+"""
+
+import os
+import sys
+
+import cffi
+
+sources = [
+    "libmgrs/mgrs.c",
+    "libmgrs/utm.c",
+    "libmgrs/ups.c",
+    "libmgrs/tranmerc.c",
+    "libmgrs/polarst.c",
+]
+
+# Same optimization flags as the libmgrs extension in setup.py; no
+# fast-math, and -march=native only on request, see the note there.
+if sys.platform == "win32":
+    extra_compile_args = ["/O2"]
+else:
+    extra_compile_args = ["-O3", "-fno-math-errno", "-ftree-vectorize"]
+    if os.environ.get("MGRS_NATIVE") == "1":
+        extra_compile_args.append("-march=native")
+
+ffibuilder = cffi.FFI()
+
+ffibuilder.cdef(
+    """
+    long Convert_Geodetic_To_MGRS (double Latitude,
+                                   double Longitude,
+                                   long Precision,
+                                   char *MGRS);
+
+    long Convert_MGRS_To_Geodetic (char *MGRS,
+                                   double *Latitude,
+                                   double *Longitude);
+
+    long Convert_UTM_To_MGRS (long Zone,
+                              char Hemisphere,
+                              double Easting,
+                              double Northing,
+                              long Precision,
+                              char *MGRS);
+
+    long Convert_MGRS_To_UTM (char *MGRS,
+                              long *Zone,
+                              char *Hemisphere,
+                              double *Easting,
+                              double *Northing);
+
+    long Convert_Geodetic_To_UTM_And_MGRS (double Latitude,
+                                           double Longitude,
+                                           long Precision,
+                                           char *MGRS,
+                                           long *Zone,
+                                           char *Hemisphere,
+                                           double *Easting,
+                                           double *Northing);
+    """
+)
+
+ffibuilder.set_source(
+    "mgrs._libmgrs",
+    '#include "mgrs.h"',
+    sources=sources,
+    include_dirs=["./libmgrs"],
+    extra_compile_args=extra_compile_args,
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
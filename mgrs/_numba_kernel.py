@@ -0,0 +1,381 @@
+"""Numba-compiled geodetic to MGRS kernel for large batch conversions.
+
+This is a line-for-line port of the forward path of libmgrs (WGS 84, UTM
+latitude bands only) taken from ``utm.c``, ``tranmerc.c`` and ``mgrs.c``.
+The operation order of the C code is preserved and ``fastmath`` is left
+off so that results are bit-identical with the library; any change here
+must keep that property.  ``MGRS.from_lat_lon_batch`` dispatches to
+:func:`geodetic_to_mgrs_batch` when numba is available and the batch is
+large enough to amortize the JIT compilation, and falls back to the C
+path for polar latitudes or on any per-point error.
+
+Importing this module requires numba; the package works without it.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+PI = 3.14159265358979323
+PI_OVER_2 = PI / 2.0
+DEG_TO_RAD = 0.017453292519943295
+RAD_TO_DEG = 57.29577951308232087
+
+MIN_UTM_LAT = (-80 * PI) / 180.0
+MAX_UTM_LAT = (84 * PI) / 180.0
+MIN_LAT = (-80.5 * PI) / 180.0
+MAX_LAT = (84.5 * PI) / 180.0
+MIN_EASTING = 100000
+MAX_EASTING = 900000
+MIN_NORTHING = 0
+MAX_NORTHING = 10000000
+MAX_PRECISION = 5
+
+ONEHT = 100000.0
+TWOMIL = 2000000.0
+
+# Ellipsoid and Transverse Mercator series constants for WGS 84, computed
+# as in Set_Transverse_Mercator_Parameters (tranmerc.c).
+_a = 6378137.0
+_f = 1 / 298.257223563
+_es = 2 * _f - _f * _f
+_ebs = (1 / (1 - _es)) - 1
+_b = _a * (1 - _f)
+_tn = (_a - _b) / (_a + _b)
+_tn2 = _tn * _tn
+_tn3 = _tn2 * _tn
+_tn4 = _tn3 * _tn
+_tn5 = _tn4 * _tn
+_ap = _a * (1.0 - _tn + 5.0 * (_tn2 - _tn3) / 4.0 + 81.0 * (_tn4 - _tn5) / 64.0)
+_bp = 3.0 * _a * (_tn - _tn2 + 7.0 * (_tn3 - _tn4) / 8.0 + 55.0 * _tn5 / 64.0) / 2.0
+_cp = 15.0 * _a * (_tn2 - _tn3 + 3.0 * (_tn4 - _tn5) / 4.0) / 16.0
+_dp = 35.0 * _a * (_tn3 - _tn4 + 11.0 * _tn5 / 16.0) / 48.0
+_ep = 315.0 * _a * (_tn4 - _tn5) / 512.0
+
+_SCALE = 0.9996
+_FALSE_EASTING = 500000.0
+
+# Latitude band letters (alphabet indices) of Latitude_Band_Table (mgrs.c).
+_LAT_BAND_LETTERS = np.array(
+    [2, 3, 4, 5, 6, 7, 9, 10, 11, 12, 13, 15, 16, 17, 18, 19, 20, 21, 22, 23],
+    dtype=np.int64,
+)
+
+
+@njit(cache=True)
+def _tranmerc_forward(latitude, longitude, origin_long, false_northing):
+    """Port of Convert_Geodetic_To_Transverse_Mercator (tranmerc.c)."""
+    if longitude > PI:
+        longitude -= 2 * PI
+
+    dlam = longitude - origin_long
+    if dlam > PI:
+        dlam -= 2 * PI
+    if dlam < -PI:
+        dlam += 2 * PI
+    if abs(dlam) < 2.0e-10:
+        dlam = 0.0
+
+    s = math.sin(latitude)
+    c = math.cos(latitude)
+    c2 = c * c
+    c3 = c2 * c
+    c5 = c3 * c2
+    c7 = c5 * c2
+    t = math.tan(latitude)
+    tan2 = t * t
+    tan3 = tan2 * t
+    tan4 = tan3 * t
+    tan5 = tan4 * t
+    tan6 = tan5 * t
+    eta = _ebs * c2
+    eta2 = eta * eta
+    eta3 = eta2 * eta
+    eta4 = eta3 * eta
+
+    # radius of curvature in prime vertical
+    sn = _a / math.sqrt(1.0 - _es * math.pow(math.sin(latitude), 2))
+
+    # true meridional distance; at the origin (latitude 0) it is exactly 0
+    tmd = (
+        _ap * latitude
+        - _bp * math.sin(2.0 * latitude)
+        + _cp * math.sin(4.0 * latitude)
+        - _dp * math.sin(6.0 * latitude)
+        + _ep * math.sin(8.0 * latitude)
+    )
+    tmdo = 0.0
+
+    # northing
+    t1 = (tmd - tmdo) * _SCALE
+    t2 = sn * s * c * _SCALE / 2.0
+    t3 = sn * s * c3 * _SCALE * (5.0 - tan2 + 9.0 * eta + 4.0 * eta2) / 24.0
+    t4 = (
+        sn
+        * s
+        * c5
+        * _SCALE
+        * (
+            61.0
+            - 58.0 * tan2
+            + tan4
+            + 270.0 * eta
+            - 330.0 * tan2 * eta
+            + 445.0 * eta2
+            + 324.0 * eta3
+            - 680.0 * tan2 * eta2
+            + 88.0 * eta4
+            - 600.0 * tan2 * eta3
+            - 192.0 * tan2 * eta4
+        )
+        / 720.0
+    )
+    t5 = sn * s * c7 * _SCALE * (1385.0 - 3111.0 * tan2 + 543.0 * tan4 - tan6) / 40320.0
+
+    northing = (
+        false_northing
+        + t1
+        + math.pow(dlam, 2.0) * t2
+        + math.pow(dlam, 4.0) * t3
+        + math.pow(dlam, 6.0) * t4
+        + math.pow(dlam, 8.0) * t5
+    )
+
+    # easting
+    t6 = sn * c * _SCALE
+    t7 = sn * c3 * _SCALE * (1.0 - tan2 + eta) / 6.0
+    t8 = (
+        sn
+        * c5
+        * _SCALE
+        * (
+            5.0
+            - 18.0 * tan2
+            + tan4
+            + 14.0 * eta
+            - 58.0 * tan2 * eta
+            + 13.0 * eta2
+            + 4.0 * eta3
+            - 64.0 * tan2 * eta2
+            - 24.0 * tan2 * eta3
+        )
+        / 120.0
+    )
+    t9 = sn * c7 * _SCALE * (61.0 - 479.0 * tan2 + 179.0 * tan4 - tan6) / 5040.0
+
+    easting = (
+        _FALSE_EASTING
+        + dlam * t6
+        + math.pow(dlam, 3.0) * t7
+        + math.pow(dlam, 5.0) * t8
+        + math.pow(dlam, 7.0) * t9
+    )
+
+    return easting, northing
+
+
+@njit(cache=True)
+def _geodetic_to_utm(latitude, longitude, override):
+    """Port of Convert_Geodetic_To_UTM (utm.c), WGS 84 parameters.
+
+    Returns (zone, is_north, easting, northing, error).
+    """
+    if latitude < MIN_LAT or latitude > MAX_LAT:
+        return 0, True, 0.0, 0.0, 1
+    if longitude < -PI or longitude > 2 * PI:
+        return 0, True, 0.0, 0.0, 1
+
+    if -1.0e-9 < latitude < 0:
+        latitude = 0.0
+    if longitude < 0:
+        longitude += (2 * PI) + 1.0e-10
+
+    lat_degrees = int(latitude * 180.0 / PI)
+    long_degrees = int(longitude * 180.0 / PI)
+
+    if longitude < PI:
+        temp_zone = int(31 + ((longitude * 180.0 / PI) / 6.0))
+    else:
+        temp_zone = int(((longitude * 180.0 / PI) / 6.0) - 29)
+
+    if temp_zone > 60:
+        temp_zone = 1
+    # UTM special cases (Norway and Svalbard)
+    if 55 < lat_degrees < 64 and -1 < long_degrees < 3:
+        temp_zone = 31
+    if 55 < lat_degrees < 64 and 2 < long_degrees < 12:
+        temp_zone = 32
+    if lat_degrees > 71 and -1 < long_degrees < 9:
+        temp_zone = 31
+    if lat_degrees > 71 and 8 < long_degrees < 21:
+        temp_zone = 33
+    if lat_degrees > 71 and 20 < long_degrees < 33:
+        temp_zone = 35
+    if lat_degrees > 71 and 32 < long_degrees < 42:
+        temp_zone = 37
+
+    if override:
+        if temp_zone == 1 and override == 60:
+            temp_zone = override
+        elif temp_zone == 60 and override == 1:
+            temp_zone = override
+        elif lat_degrees > 71 and -1 < long_degrees < 42:
+            if temp_zone - 2 <= override <= temp_zone + 2:
+                temp_zone = override
+            else:
+                return 0, True, 0.0, 0.0, 1
+        elif temp_zone - 1 <= override <= temp_zone + 1:
+            temp_zone = override
+        else:
+            return 0, True, 0.0, 0.0, 1
+
+    if temp_zone >= 31:
+        central_meridian = (6 * temp_zone - 183) * PI / 180.0
+    else:
+        central_meridian = (6 * temp_zone + 177) * PI / 180.0
+
+    if latitude < 0:
+        false_northing = 10000000.0
+        is_north = False
+    else:
+        false_northing = 0.0
+        is_north = True
+
+    easting, northing = _tranmerc_forward(
+        latitude, longitude, central_meridian, false_northing
+    )
+    if easting < MIN_EASTING or easting > MAX_EASTING:
+        return 0, True, 0.0, 0.0, 1
+    if northing < MIN_NORTHING or northing > MAX_NORTHING:
+        return 0, True, 0.0, 0.0, 1
+    return temp_zone, is_north, easting, northing, 0
+
+
+@njit(cache=True)
+def _latitude_letter(latitude):
+    """Port of Get_Latitude_Letter (mgrs.c); returns -1 out of range."""
+    lat_deg = latitude * RAD_TO_DEG
+    if 72 <= lat_deg < 84.5:
+        return 23  # LETTER_X
+    elif -80.5 < lat_deg < 72:
+        temp = ((latitude + (80.0 * DEG_TO_RAD)) / (8.0 * DEG_TO_RAD)) + 1.0e-12
+        return _LAT_BAND_LETTERS[int(temp)]
+    return -1
+
+
+@njit(cache=True)
+def _geodetic_to_mgrs(latitude, longitude, precision, record):
+    """Port of Convert_Geodetic_To_MGRS / UTM_To_MGRS for the UTM bands.
+
+    Writes the MGRS string into `record`, a uint8[16] row. Returns 0 on
+    success and nonzero on any error; the caller is expected to redo
+    erroneous points through the C library to get a proper error code.
+    """
+    if latitude < -PI_OVER_2 or latitude > PI_OVER_2:
+        return 1
+    if longitude < -PI or longitude > 2 * PI:
+        return 1
+    if precision < 0 or precision > MAX_PRECISION:
+        return 1
+    if latitude < MIN_UTM_LAT or latitude > MAX_UTM_LAT:
+        return 1  # polar point, needs the UPS path
+
+    zone, is_north, easting, northing, error = _geodetic_to_utm(latitude, longitude, 0)
+    if error:
+        return error
+
+    # UTM_To_MGRS: rounding to the (truncated) eastern edge of zone 31V
+    # falls over into zone 32
+    if (
+        zone == 31
+        and (56.0 * DEG_TO_RAD <= latitude < 64.0 * DEG_TO_RAD)
+        and (longitude >= 3.0 * DEG_TO_RAD or easting >= 500000.0)
+    ):
+        zone, is_north, easting, northing, error = _geodetic_to_utm(
+            latitude, longitude, 32
+        )
+        if error:
+            return error
+
+    if latitude <= 0.0 and northing == 1.0e7:
+        latitude = 0.0
+        northing = 0.0
+
+    # Get_Grid_Values, WGS 84 so the AA pattern applies
+    set_number = zone % 6
+    if set_number == 0:
+        set_number = 6
+    if set_number == 1 or set_number == 4:
+        ltr2_low_value = 0  # LETTER_A
+    elif set_number == 2 or set_number == 5:
+        ltr2_low_value = 9  # LETTER_J
+    else:
+        ltr2_low_value = 18  # LETTER_S
+    if set_number % 2 == 0:
+        pattern_offset = 500000.0
+    else:
+        pattern_offset = 0.0
+
+    letter0 = _latitude_letter(latitude)
+    if letter0 < 0:
+        return 1
+
+    grid_northing = northing
+    while grid_northing >= TWOMIL:
+        grid_northing = grid_northing - TWOMIL
+    grid_northing = grid_northing + pattern_offset
+    if grid_northing >= TWOMIL:
+        grid_northing = grid_northing - TWOMIL
+
+    letter2 = int(grid_northing / ONEHT)
+    if letter2 > 7:  # LETTER_H
+        letter2 = letter2 + 1
+    if letter2 > 13:  # LETTER_N
+        letter2 = letter2 + 1
+
+    grid_easting = easting
+    if letter0 == 21 and zone == 31 and grid_easting == 500000.0:  # LETTER_V
+        grid_easting = grid_easting - 1.0  # subtract 1 meter
+
+    letter1 = ltr2_low_value + (int(grid_easting / ONEHT) - 1)
+    if ltr2_low_value == 9 and letter1 > 13:  # LETTER_J, LETTER_N
+        letter1 = letter1 + 1
+
+    # Make_MGRS_String(zone, letters, grid_easting, northing, precision)
+    record[0] = 48 + zone // 10
+    record[1] = 48 + zone % 10
+    record[2] = 65 + letter0
+    record[3] = 65 + letter1
+    record[4] = 65 + letter2
+
+    divisor = math.pow(10.0, 5 - precision)
+    east_m = np.fmod(grid_easting, 100000.0)
+    if east_m >= 99999.5:
+        east_m = 99999.0
+    east = int(east_m / divisor)
+    for j in range(precision - 1, -1, -1):
+        record[5 + j] = 48 + east % 10
+        east = east // 10
+    north_m = np.fmod(northing, 100000.0)
+    if north_m >= 99999.5:
+        north_m = 99999.0
+    north = int(north_m / divisor)
+    for j in range(precision - 1, -1, -1):
+        record[5 + precision + j] = 48 + north % 10
+        north = north // 10
+    return 0
+
+
+@njit(parallel=True, cache=True)
+def geodetic_to_mgrs_batch(latitudes, longitudes, precision, out):
+    """Convert arrays of lat/lon in radians to MGRS uint8[n, 16] records.
+
+    Returns an array of per-point error flags; rows with a nonzero flag
+    are left blank and should be redone through the C library.
+    """
+    n = latitudes.shape[0]
+    errors = np.zeros(n, dtype=np.int64)
+    for i in prange(n):
+        errors[i] = _geodetic_to_mgrs(latitudes[i], longitudes[i], precision, out[i])
+    return errors
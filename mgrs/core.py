@@ -2,6 +2,7 @@ import ctypes
 import math
 import os
 import sysconfig
+import threading
 from ctypes.util import find_library
 
 import packaging.tags
@@ -194,12 +195,16 @@ def get_errors(value):
     return output[:-2]
 
 
+DEG_TO_RAD = math.pi / 180.0
+RAD_TO_DEG = 180.0 / math.pi
+
+
 def TO_RADIANS(degrees):
-    return float(degrees) * math.pi / 180.0
+    return float(degrees) * DEG_TO_RAD
 
 
 def TO_DEGREES(radians):
-    return float(radians) * 180.0 / math.pi
+    return float(radians) * RAD_TO_DEG
 
 
 def check_error(result, func, cargs):
@@ -272,7 +277,7 @@ rt.Convert_MGRS_To_Geodetic.errcheck = check_error
 #  *    MGRS       : MGRS coordinate string           (output)
 #  */
 
-rt.Convert_UTM_To_MGRS.argtype = [
+rt.Convert_UTM_To_MGRS.argtypes = [
     ctypes.c_long,
     ctypes.c_char,
     ctypes.c_double,
@@ -297,7 +302,7 @@ rt.Convert_UTM_To_MGRS.errcheck = check_error
 #  *    Northing   : Northing (Y) in meters           (output)
 #  */
 
-rt.Convert_MGRS_To_UTM.argtype = [
+rt.Convert_MGRS_To_UTM.argtypes = [
     ctypes.c_char_p,
     ctypes.POINTER(ctypes.c_long),
     ctypes.POINTER(ctypes.c_char),
@@ -306,3 +311,285 @@ rt.Convert_MGRS_To_UTM.argtype = [
 ]
 rt.Convert_MGRS_To_UTM.restype = ctypes.c_long
 rt.Convert_MGRS_To_UTM.errcheck = check_error
+
+# /*
+#  * The function Convert_Geodetic_To_UTM_And_MGRS converts geodetic (latitude
+#  * and longitude) coordinates to an MGRS coordinate string and also returns
+#  * the intermediate UTM (zone, hemisphere, easting and northing) coordinates,
+#  * running the UTM projection only once.  Only latitudes within the UTM
+#  * range are supported; polar coordinates return MGRS_LAT_ERROR.
+#  *
+#  *    Latitude   : Latitude in radians              (input)
+#  *    Longitude  : Longitude in radians             (input)
+#  *    Precision  : Precision level of MGRS string   (input)
+#  *    MGRS       : MGRS coordinate string           (output)
+#  *    Zone       : UTM zone                         (output)
+#  *    Hemisphere : North or South hemisphere        (output)
+#  *    Easting    : Easting (X) in meters            (output)
+#  *    Northing   : Northing (Y) in meters           (output)
+#  */
+
+rt.Convert_Geodetic_To_UTM_And_MGRS.argtypes = [
+    ctypes.c_double,
+    ctypes.c_double,
+    ctypes.c_long,
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_long),
+    ctypes.POINTER(ctypes.c_char),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+]
+rt.Convert_Geodetic_To_UTM_And_MGRS.restype = ctypes.c_long
+rt.Convert_Geodetic_To_UTM_And_MGRS.errcheck = check_error
+
+# Batch variants of the four conversions above.  Each processes `Count`
+# points with a single library call; MGRS strings are packed as fixed
+# 16-byte null-terminated records.
+
+#   long Convert_Geodetic_To_MGRS_Batch (const double* Latitude,
+#                                        const double* Longitude,
+#                                        long Count,
+#                                        long Precision,
+#                                        char *MGRS);
+
+rt.Convert_Geodetic_To_MGRS_Batch.argtypes = [
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.c_long,
+    ctypes.c_long,
+    ctypes.c_char_p,
+]
+rt.Convert_Geodetic_To_MGRS_Batch.restype = ctypes.c_long
+rt.Convert_Geodetic_To_MGRS_Batch.errcheck = check_error
+
+#   long Convert_MGRS_To_Geodetic_Batch (char *MGRS,
+#                                        long Count,
+#                                        double* Latitude,
+#                                        double* Longitude);
+
+rt.Convert_MGRS_To_Geodetic_Batch.argtypes = [
+    ctypes.c_char_p,
+    ctypes.c_long,
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+]
+rt.Convert_MGRS_To_Geodetic_Batch.restype = ctypes.c_long
+rt.Convert_MGRS_To_Geodetic_Batch.errcheck = check_error
+
+#   long Convert_UTM_To_MGRS_Batch (const long* Zone,
+#                                   const char* Hemisphere,
+#                                   const double* Easting,
+#                                   const double* Northing,
+#                                   long Count,
+#                                   long Precision,
+#                                   char *MGRS);
+
+rt.Convert_UTM_To_MGRS_Batch.argtypes = [
+    ctypes.POINTER(ctypes.c_long),
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.c_long,
+    ctypes.c_long,
+    ctypes.c_char_p,
+]
+rt.Convert_UTM_To_MGRS_Batch.restype = ctypes.c_long
+rt.Convert_UTM_To_MGRS_Batch.errcheck = check_error
+
+#   long Convert_MGRS_To_UTM_Batch (char *MGRS,
+#                                   long Count,
+#                                   long *Zone,
+#                                   char *Hemisphere,
+#                                   double *Easting,
+#                                   double *Northing);
+
+rt.Convert_MGRS_To_UTM_Batch.argtypes = [
+    ctypes.c_char_p,
+    ctypes.c_long,
+    ctypes.POINTER(ctypes.c_long),
+    ctypes.c_char_p,
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+]
+rt.Convert_MGRS_To_UTM_Batch.restype = ctypes.c_long
+rt.Convert_MGRS_To_UTM_Batch.errcheck = check_error
+
+
+# Scalar conversion functions. When the cffi API-mode bindings built from
+# mgrs/_build_ffi.py are available, they are preferred over ctypes, which
+# pays libffi's type-marshalling cost on every call. The ctypes path above
+# is kept so that installs without cffi keep working, and for the batch
+# conversions where the call overhead is amortized anyway.
+
+try:
+    from ._libmgrs import ffi as _ffi
+    from ._libmgrs import lib as _lib
+except ImportError:
+    _ffi = None
+    _lib = None
+
+
+if _lib is not None:
+
+    def _check(result, name):
+        "Error checking proper value returns, for the cffi bindings"
+        if result != 0:
+            msg = 'Error in "%s": %s' % (name, get_errors(result))
+            raise MGRSError(msg)
+        return
+
+    def geodetic_to_mgrs(latitude: float, longitude: float, precision: int) -> str:
+        """Convert geodetic coordinates, in radians, to an MGRS string."""
+        mgrs = _ffi.new("char[16]")
+        _check(
+            _lib.Convert_Geodetic_To_MGRS(latitude, longitude, precision, mgrs),
+            "Convert_Geodetic_To_MGRS",
+        )
+        return _ffi.string(mgrs).decode("ascii")
+
+    def mgrs_to_geodetic(mgrs: bytes) -> tuple[float, float]:
+        """Convert an MGRS string to latitude/longitude, in radians."""
+        plat = _ffi.new("double*")
+        plon = _ffi.new("double*")
+        _check(
+            _lib.Convert_MGRS_To_Geodetic(mgrs, plat, plon),
+            "Convert_MGRS_To_Geodetic",
+        )
+        return (plat[0], plon[0])
+
+    def utm_to_mgrs(
+        zone: int, hemisphere: bytes, easting: float, northing: float, precision: int
+    ) -> str:
+        """Convert UTM coordinates to an MGRS string."""
+        mgrs = _ffi.new("char[16]")
+        _check(
+            _lib.Convert_UTM_To_MGRS(
+                zone, hemisphere, easting, northing, precision, mgrs
+            ),
+            "Convert_UTM_To_MGRS",
+        )
+        return _ffi.string(mgrs).decode("ascii")
+
+    def mgrs_to_utm(mgrs: bytes) -> tuple[int, bytes, float, float]:
+        """Convert an MGRS string to UTM (zone, hemisphere, easting, northing)."""
+        pzone = _ffi.new("long*")
+        phemisphere = _ffi.new("char*")
+        peasting = _ffi.new("double*")
+        pnorthing = _ffi.new("double*")
+        _check(
+            _lib.Convert_MGRS_To_UTM(mgrs, pzone, phemisphere, peasting, pnorthing),
+            "Convert_MGRS_To_UTM",
+        )
+        return (pzone[0], phemisphere[0], peasting[0], pnorthing[0])
+
+    def geodetic_to_utm_and_mgrs(
+        latitude: float, longitude: float, precision: int
+    ) -> tuple[str, int, bytes, float, float]:
+        """Convert geodetic coordinates, in radians, to MGRS and UTM at once."""
+        mgrs = _ffi.new("char[16]")
+        pzone = _ffi.new("long*")
+        phemisphere = _ffi.new("char*")
+        peasting = _ffi.new("double*")
+        pnorthing = _ffi.new("double*")
+        _check(
+            _lib.Convert_Geodetic_To_UTM_And_MGRS(
+                latitude,
+                longitude,
+                precision,
+                mgrs,
+                pzone,
+                phemisphere,
+                peasting,
+                pnorthing,
+            ),
+            "Convert_Geodetic_To_UTM_And_MGRS",
+        )
+        return (
+            _ffi.string(mgrs).decode("ascii"),
+            pzone[0],
+            phemisphere[0],
+            peasting[0],
+            pnorthing[0],
+        )
+
+else:
+
+    # Output buffers are allocated once per thread and reused, instead of
+    # building fresh ctypes pointer objects on every call.
+    _tls = threading.local()
+
+    def _out_buffers():
+        try:
+            return _tls.buffers
+        except AttributeError:
+            _tls.buffers = (
+                # an MGRS string is at most 15 characters plus the terminator
+                ctypes.create_string_buffer(16),
+                ctypes.c_long(),
+                ctypes.c_char(),
+                ctypes.c_double(),
+                ctypes.c_double(),
+            )
+            return _tls.buffers
+
+    def geodetic_to_mgrs(latitude: float, longitude: float, precision: int) -> str:
+        """Convert geodetic coordinates, in radians, to an MGRS string."""
+        mgrs = _out_buffers()[0]
+        rt.Convert_Geodetic_To_MGRS(latitude, longitude, precision, mgrs)
+        return mgrs.value.decode("ascii")
+
+    def mgrs_to_geodetic(mgrs: bytes) -> tuple[float, float]:
+        """Convert an MGRS string to latitude/longitude, in radians."""
+        lat, lon = _out_buffers()[3:]
+        rt.Convert_MGRS_To_Geodetic(mgrs, ctypes.byref(lat), ctypes.byref(lon))
+        return (lat.value, lon.value)
+
+    def utm_to_mgrs(
+        zone: int, hemisphere: bytes, easting: float, northing: float, precision: int
+    ) -> str:
+        """Convert UTM coordinates to an MGRS string."""
+        mgrs = _out_buffers()[0]
+        rt.Convert_UTM_To_MGRS(
+            zone,
+            ctypes.c_char(hemisphere),
+            ctypes.c_double(easting),
+            ctypes.c_double(northing),
+            precision,
+            mgrs,
+        )
+        return mgrs.value.decode("ascii")
+
+    def mgrs_to_utm(mgrs: bytes) -> tuple[int, bytes, float, float]:
+        """Convert an MGRS string to UTM (zone, hemisphere, easting, northing)."""
+        _, zone, hemisphere, easting, northing = _out_buffers()
+        rt.Convert_MGRS_To_UTM(
+            mgrs,
+            ctypes.byref(zone),
+            ctypes.byref(hemisphere),
+            ctypes.byref(easting),
+            ctypes.byref(northing),
+        )
+        return (zone.value, hemisphere.value, easting.value, northing.value)
+
+    def geodetic_to_utm_and_mgrs(
+        latitude: float, longitude: float, precision: int
+    ) -> tuple[str, int, bytes, float, float]:
+        """Convert geodetic coordinates, in radians, to MGRS and UTM at once."""
+        mgrs, zone, hemisphere, easting, northing = _out_buffers()
+        rt.Convert_Geodetic_To_UTM_And_MGRS(
+            latitude,
+            longitude,
+            precision,
+            mgrs,
+            ctypes.byref(zone),
+            ctypes.byref(hemisphere),
+            ctypes.byref(easting),
+            ctypes.byref(northing),
+        )
+        return (
+            mgrs.value.decode("ascii"),
+            zone.value,
+            hemisphere.value,
+            easting.value,
+            northing.value,
+        )
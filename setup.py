@@ -1,4 +1,6 @@
 import codecs
+import os
+import sys
 
 from setuptools import Extension, setup
 
@@ -10,6 +12,18 @@ sources = [
     "libmgrs/polarst.c",
 ]
 
+# The conversions are pure floating-point polynomial evaluation, so let the
+# compiler optimize and vectorize them. Fast-math style flags are
+# deliberately not used: they can change results exactly at grid
+# boundaries. -march=native is opt-in (MGRS_NATIVE=1) so that distributed
+# wheels stay portable.
+if sys.platform == "win32":
+    extra_compile_args = ["/O2"]
+else:
+    extra_compile_args = ["-O3", "-fno-math-errno", "-ftree-vectorize"]
+    if os.environ.get("MGRS_NATIVE") == "1":
+        extra_compile_args.append("-march=native")
+
 
 mgrs = Extension(
     "libmgrs",
@@ -18,12 +32,22 @@ mgrs = Extension(
     include_dirs=["./libmgrs"],
     libraries=None,
     library_dirs=None,
+    extra_compile_args=extra_compile_args,
 )
 
 
 with codecs.open("./README.rst", encoding="utf-8") as f:
     readme_text = f.read()
 
+# Build the faster cffi API-mode bindings when cffi is available; the
+# package falls back to the ctypes bindings otherwise.
+try:
+    import cffi  # noqa: F401
+
+    cffi_kwargs = {"cffi_modules": ["mgrs/_build_ffi.py:ffibuilder"]}
+except ImportError:
+    cffi_kwargs = {}
+
 setup(
     name="mgrs",
     version="2.0",
@@ -38,7 +62,7 @@ setup(
     long_description=readme_text,
     long_description_content_type="text/x-rst",
     ext_modules=[mgrs],
-    install_requires=["packaging"],
+    install_requires=["numpy", "packaging"],
     packages=["mgrs"],
     test_suite="tests.test_suite",
     zip_safe=False,
@@ -54,4 +78,5 @@ setup(
         "Topic :: Scientific/Engineering :: GIS",
         "Topic :: Database",
     ],
+    **cffi_kwargs,
 )